@@ -1,4 +1,4 @@
-from .classes import PlayerCharacter, NCTier1, NCTier2
-from .utils import Character
+from .classes import PlayerCharacter, NCTier1, NCTier2, NCTier3
+from .utils import Ability, Character
 
-__all__ = ["Character", "PlayerCharacter", "NCTier1", "NCTier2", "NCTier3"]
+__all__ = ["Ability", "Character", "PlayerCharacter", "NCTier1", "NCTier2", "NCTier3"]
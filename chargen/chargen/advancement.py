@@ -0,0 +1,199 @@
+import numpy as np
+from . import utils
+from .classes import PlayerCharacter
+
+
+# Experience needed to raise an ability from the rank used as index to the next one
+step_cost = [utils.ability_costs[rank + 1] - utils.ability_costs[rank] for rank in utils.ranks[:-1]]
+
+# The same costs by age bracket and rank: ranks that cannot be raised any further for the age
+# cost more than any character will ever have
+bracket_step_cost = np.array([
+    [cost if rank < max_rank else 10 ** 9 for rank, cost in enumerate(step_cost)]
+    for max_rank in PlayerCharacter.ab_max_rank
+])
+
+# Age bracket and status for each result of the dice, rolls below the minimum are never used
+age_by_roll = np.array([utils.set_age(roll) if roll >= 3 else 0 for roll in range(19)])
+status_by_roll = np.array([utils.set_status(roll) if roll >= 2 else 0 for roll in range(13)])
+
+# Chance of each background event, rolled on 2d6
+event_weights = np.array([6 - abs(roll - 7) for roll in range(2, 13)]) / 36
+
+
+def roll_dice(rng, n, size):
+    """Roll ``n``d6 ``size`` times"""
+    return rng.integers(1, 7, size=(size, n)).sum(axis=1)
+
+
+class Roster:
+    """A roster of characters advancing over campaign time
+
+    The roster is stored as numpy arrays with a row for each character, every tick updates the
+    whole roster at once.
+
+    Each year every character:
+
+        - Ages by one year, crossing into a new age bracket gains the difference in ability and specialty
+          points between the brackets and new background events up to the number allowed for the age.
+          When the maximum rank for the new age is lower, the abilities above it are lowered to it and
+          the experience paid for the ranks lost is refunded, so the character stays legal for
+          ``validate_abilities``
+        - Gains experience, rolled as 1d6 * 10 like ``NCTier1``
+        - Tries to raise ``purchases`` random abilities by one rank, paying the costs of ``validate_abilities``
+          and never exceeding the maximum rank for the age
+
+    Args:
+        ages (list): The age in years of each character.
+        exp (list): The unspent experience of each character.
+        ranks (dict): The ranks of each character by ability name, unlisted abilities are at rank 2.
+        events (list): The background events of each character.
+        purchases (int): The number of abilities each character tries to raise per year.
+        seed (int): The seed of the random generator, or the ``numpy.random.Generator`` to use.
+    """
+    exp_gains = [10, 20, 30, 40, 50, 60]
+
+    def __init__(self, ages, exp=None, ranks=None, events=None, purchases=2, seed=None):
+        n = len(ages)
+        self.size = n
+        self.purchases = purchases
+        self.rng = np.random.default_rng(seed)
+        self.ages = np.array(ages, dtype=np.int64)
+        self.age_vals = np.searchsorted(utils.age_bounds, self.ages, side="right") - 1
+        self.exp = np.array(exp if exp is not None else [0] * n, dtype=np.int64)
+        self.spec = np.zeros(n, dtype=np.int64)
+
+        # One column per ability, in the order of ``utils.abilities``
+        self.ranks = np.full((n, len(utils.abilities)), 2, dtype=np.int64)
+        for a, name in enumerate(utils.abilities):
+            if ranks and name in ranks:
+                self.ranks[:, a] = ranks[name]
+        if n and self.ranks.max() >= len(step_cost):
+            raise ValueError("Ranks above {} are not supported".format(len(step_cost) - 1))
+
+        # One column per background event, in the order of ``utils.backgrounds``
+        self.events = np.zeros((n, len(utils.backgrounds)), dtype=bool)
+        for i, char_events in enumerate(events or []):
+            for event in char_events:
+                self.events[i, utils.backgrounds.index(event)] = True
+
+    @classmethod
+    def generate(cls, count, **kwargs):
+        """Randomly generate a roster with the starting budgets of ``PlayerCharacter``
+
+        Args:
+            count (int): The number of characters to generate.
+
+        Returns:
+            Roster: The generated roster
+        """
+        # The roster keeps drawing from the same generator
+        rng = np.random.default_rng(kwargs.pop("seed", None))
+        vals = age_by_roll[roll_dice(rng, 3, count)]
+        # The Status is rolled regardless of the age, keep it within the maximum rank like any other ability
+        statuses = np.minimum(status_by_roll[roll_dice(rng, 2, count)], np.take(PlayerCharacter.ab_max_rank, vals))
+        roster = cls(
+            np.array(utils.age_bounds)[vals],
+            exp=np.array(PlayerCharacter.ab_points)[vals] - np.array(utils.ability_costs)[statuses],
+            ranks={"Status": statuses},
+            seed=rng,
+            **kwargs
+        )
+        roster.spec = np.array(PlayerCharacter.spec_points)[vals]
+        roster.add_events(np.arange(count))
+        return roster
+
+    @classmethod
+    def from_characters(cls, chars, **kwargs):
+        """Build a roster from existing characters
+
+        Points still to spend on freshly generated characters are added to their experience.
+
+        Args:
+            chars (list): The characters to add to the roster.
+
+        Returns:
+            Roster: The roster, in the same order as ``chars``
+        """
+        exp = []
+        spec = []
+        for char in chars:
+            abilities = char.data["Abilities"]
+            exp.append(abilities.get("Experience", 0) + abilities.get("Abilities Points", 0))
+            spec.append(abilities.get("Specialties points", 0))
+        roster = cls(
+            [char.age for char in chars],
+            exp=exp,
+            ranks={name: [char.get_rank(name) for char in chars] for name in utils.abilities},
+            events=[char.data.get("Background", {}).get("Events", []) for char in chars],
+            **kwargs
+        )
+        roster.spec = np.array(spec, dtype=np.int64)
+        return roster
+
+    def get_rank(self, i, ability):
+        """Get the rank of an ability of the ``i``-th character"""
+        return int(self.ranks[i, utils.abilities.index(ability)])
+
+    def add_events(self, rows):
+        """Roll new background events for the characters in ``rows`` until each has as many as its age bracket
+
+        Events are drawn with the chances of 2d6 among the ones the character does not have yet.
+        """
+        rows = rows[self.events[rows].sum(axis=1) < self.age_vals[rows]]
+        while len(rows):
+            # Gumbel-max trick: the largest perturbed log weight is a weighted pick, owned events are excluded
+            keys = np.log(event_weights) + self.rng.gumbel(size=(len(rows), len(event_weights)))
+            keys[self.events[rows]] = -np.inf
+            self.events[rows, keys.argmax(axis=1)] = True
+            rows = rows[self.events[rows].sum(axis=1) < self.age_vals[rows]]
+
+    def tick(self):
+        """Advance every character in the roster by one year"""
+        n = self.size
+        self.ages += 1
+
+        crossed = np.flatnonzero(np.isin(self.ages, utils.age_bounds))
+        old = self.age_vals[crossed]
+        new = old + 1
+        self.age_vals[crossed] = new
+        self.exp[crossed] += np.take(PlayerCharacter.ab_points, new) - np.take(PlayerCharacter.ab_points, old)
+        self.spec[crossed] += np.take(PlayerCharacter.spec_points, new) - np.take(PlayerCharacter.spec_points, old)
+        self.add_events(crossed)
+
+        current = self.ranks[crossed]
+        capped = np.minimum(current, np.take(PlayerCharacter.ab_max_rank, new)[:, None])
+        self.exp[crossed] += (np.take(utils.ability_costs, current) - np.take(utils.ability_costs, capped)).sum(axis=1)
+        self.ranks[crossed] = capped
+
+        self.exp += self.rng.choice(self.exp_gains, size=n)
+
+        rows = np.arange(n)
+        for _ in range(self.purchases):
+            picks = self.rng.integers(0, len(utils.abilities), size=n)
+            costs = bracket_step_cost[self.age_vals, self.ranks[rows, picks]]
+            bought = costs <= self.exp
+            self.exp -= np.where(bought, costs, 0)
+            np.add.at(self.ranks, (rows[bought], picks[bought]), 1)
+
+    def advance(self, years):
+        """Advance every character in the roster by ``years`` years"""
+        for _ in range(years):
+            self.tick()
+
+    def character_data(self, i):
+        """Get the advanced data of the ``i``-th character, in the format used by the character classes
+
+        Returns:
+            dict: The abilities and background of the character, abilities at rank 2 are omitted
+        """
+        abilities = {name: int(rank) for name, rank in zip(utils.abilities, self.ranks[i]) if rank != 2}
+        abilities["Experience"] = int(self.exp[i])
+        abilities["Specialties points"] = int(self.spec[i])
+        return {
+            "Abilities": abilities,
+            "Background": {
+                "Age": int(self.ages[i]),
+                "Events": [event for event, has in zip(utils.backgrounds, self.events[i]) if has]
+            }
+        }
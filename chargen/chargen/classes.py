@@ -1,4 +1,3 @@
-import math
 from . import utils
 
 
@@ -84,20 +83,20 @@ class PlayerCharacter(utils.Character):
 
     def __init__(self, name="Ser Example", data=None, age=None):
         super().__init__(name, data, age)
-        self.data["Background"] = self.generate_bg()
+        if not data:
+            self.data["Background"] = self.generate_bg()
 
     def generate_abilities(self):
         """Generate the ability and specialities points available to spend. Include handbook pages"""
-        status = utils.set_status()
-        status_exp = (status - 2) * 30 - 20
+        status = utils.Ability("Status", utils.set_status())
         abilities = {
             "Abilities List": "p56",
             "Abilities Costs": "p50",
             "Specialties Costs": "p51",
-            "Abilities Points": self.ab_points[self.ageVal] - status_exp,
+            "Abilities Points": self.ab_points[self.ageVal] - status.cost,
             "Specialties points": self.spec_points[self.ageVal],
             "Experience": 0,
-            "Status": status
+            "Status": status.to_data()
         }
         return abilities
 
@@ -120,7 +119,7 @@ class PlayerCharacter(utils.Character):
         """Random generation of background informations"""
         status = self.get_rank("Status")
         bg = {
-            "Age": str(utils.ages[self.ageVal]),
+            "Age": self.age,
             "Status": utils.statuses[status - 2],
             "Goal": utils.goals[utils.roller(2) - 2],
             "Motivation": utils.motivations[utils.roller(2) - 2],
@@ -171,7 +170,7 @@ class PlayerCharacter(utils.Character):
         Returns:
             bool: True if none of the checks fails
         """
-        legal = True
+        legal = self.validate_ability_entries()
         ab_total = self.ab_points[self.ageVal]
         spec_total = self.spec_points[self.ageVal]
         try:
@@ -179,17 +178,18 @@ class PlayerCharacter(utils.Character):
         except KeyError:
             flaws = []
 
-        for ab in self.data["Abilities"]:
-            rank = self.get_rank(ab)
-            if ab in flaws:
+        for ab in self.abilities.values():
+            rank = ab.rank
+            if ab.name in flaws:
                 rank += 1
-            if rank > 2:
-                print("{}: {} exp {}".format(ab, rank, (rank - 2) * 30 - 20))
-                ab_total -= (rank - 2) * 30 - 20
             if rank > self.ab_max_rank[self.ageVal]:
                 print("{} at {} exceeds the maximum value of {} for the age".format(
-                    ab, rank, self.ab_max_rank[self.ageVal]
+                    ab.name, rank, self.ab_max_rank[self.ageVal]
                 ))
+                legal = False
+            elif utils.ability_costs[rank]:
+                print("{}: {} exp {}".format(ab.name, rank, utils.ability_costs[rank]))
+                ab_total -= utils.ability_costs[rank]
             sp_legal, sp = self.validate_specialties(ab)
             if not sp_legal:
                 legal = False
@@ -243,17 +243,20 @@ class PlayerCharacter(utils.Character):
         return legal
 
     def validate_specialties(self, ability):
+        """Check the specialties of an ability do not exceed its rank
+
+        Args:
+            ability (utils.Ability): The ability to check
+
+        Returns:
+            tuple: True if none of the checks fails, the specialty points spent
+        """
         legal = True
-        total = 0
-        if type(ability) == dict:
-            for spec, val in ability:
-                if spec is not "Stat":
-                    total += val * 10
-                    rank = self.get_rank(ability)
-                    if val > rank:
-                        print("{} at {} exceeds the {} rank of {}".format(spec, val, ability, rank))
-                        legal = False
-        return legal, total
+        for spec, val in ability.specialties.items():
+            if val > ability.rank:
+                print("{} at {} exceeds the {} rank of {}".format(spec, val, ability.name, ability.rank))
+                legal = False
+        return legal, ability.specialty_cost
 
 
 class NCTier3(utils.Character):
@@ -281,19 +284,23 @@ class NCTier3(utils.Character):
         }
 
     def validate_specialties(self, ability):
+        """Check every specialty is at rank 1
+
+        Args:
+            ability (utils.Ability): The ability to check
+
+        Returns:
+            tuple: True if none of the checks fails, the number of specialties
+        """
         legal = True
-        total = 0
-        ab = self.data["Abilities"][ability]
-        if type(ab) == dict:
-            for spec, val in ab:
-                if spec is not "Stat":
-                    if val != 1:
-                        print("{} should be 1, is {}".format(spec, val))
-                        legal = False
-        return legal, total
+        for spec, val in ability.specialties.items():
+            if val != 1:
+                print("{} should be 1, is {}".format(spec, val))
+                legal = False
+        return legal, len(ability.specialties)
 
     def validate_abilities(self):
-        legal = True
+        legal = self.validate_ability_entries()
         spec_total = 3
         ab_checklist = []
         ab_checklist_allowed = [
@@ -303,9 +310,8 @@ class NCTier3(utils.Character):
             [3, 3, 4, 4]
         ]
 
-        for ab in self.data["Abilities"]:
-            rank = self.get_rank(ab)
-            ab_checklist.append(rank)
+        for ab in self.abilities.values():
+            ab_checklist.append(ab.rank)
             sp_legal, sp = self.validate_specialties(ab)
             if not sp_legal:
                 legal = False
@@ -353,29 +359,32 @@ class NCTier2(NCTier3):
         return abilities
 
     def validate_specialties(self, ability):
+        """Check every specialty is at half the ability rank (rounded down)
+
+        Args:
+            ability (utils.Ability): The ability to check
+
+        Returns:
+            tuple: True if none of the checks fails, the number of specialties
+        """
         legal = True
-        total = 0
-        if type(ability) == dict:
-            for spec, val in ability:
-                if spec is not "Stat":
-                    total += 1
-                    rank = self.get_rank(ability)
-                    if val != math.floor(rank):
-                        print("{} at {} exceeds half of the {} rank of {}".format(spec, val, ability, rank))
-                        legal = False
-        return legal, total
+        half = utils.half_ranks[ability.rank]
+        for spec, val in ability.specialties.items():
+            if val != half:
+                print("{} at {} is not half of the {} rank of {}".format(spec, val, ability.name, ability.rank))
+                legal = False
+        return legal, len(ability.specialties)
 
     def validate_abilities(self):
-        legal = True
+        legal = self.validate_ability_entries()
         ab_checklist = [5, 4, 4, 3, 3, 3, 3]
         spec_total = 4
 
-        for ab in self.data["Abilities"]:
-            rank = self.get_rank(ab)
+        for ab in self.abilities.values():
             try:
-                ab_checklist.remove(rank)
+                ab_checklist.remove(ab.rank)
             except ValueError:
-                print("{} rank {} is not in checklist {}".format(ab, rank, ab_checklist))
+                print("{} rank {} is not in checklist {}".format(ab.name, ab.rank, ab_checklist))
                 legal = False
             sp_legal, sp = self.validate_specialties(ab)
             if not sp_legal:
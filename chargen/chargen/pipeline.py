@@ -0,0 +1,297 @@
+import contextlib
+import io
+import itertools
+import multiprocessing
+import os
+import pickle
+import queue
+import random
+import threading
+import traceback
+import yaml
+from . import utils
+from .classes import PlayerCharacter
+
+FORMATS = ("yaml", "binary")
+
+# Use the libyaml bindings when available, the pure python ones are much slower
+Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def roll(count, age=None, prefix="Ser Example"):
+    """Roll the name and age of ``count`` characters
+
+    Args:
+        count (int): The number of characters to roll.
+        age (int): When set every character gets this age, otherwise it is rolled on 3d6.
+        prefix (str): The name of the characters, a progressive number is appended to it.
+
+    Yields:
+        tuple: ``(name, age)``
+    """
+    for i in range(count):
+        char_age = age if age is not None else utils.val_to_age(utils.set_age(utils.roller(3)))
+        yield "{} {}".format(prefix, i + 1), char_age
+
+
+def build(rolls, char_class=PlayerCharacter):
+    """Build a character for each rolled name and age
+
+    Yields:
+        utils.Character: The generated character
+    """
+    for name, age in rolls:
+        yield char_class(name=name, age=age)
+
+
+def from_data(records, char_class=PlayerCharacter):
+    """Build a character for each ``(name, data)`` pair, as yielded by :func:`load`
+
+    Yields:
+        utils.Character: The character
+    """
+    for name, data in records:
+        yield char_class(name=name, data=data)
+
+
+def validated(chars):
+    """Validate every character, marking the illegal ones through ``is_legal``
+
+    The messages printed by the checks are collected in the ``report`` attribute of the character.
+    Only characters built from complete data (see :func:`from_data`) can be validated,
+    freshly generated ones only list the points available to spend.
+
+    Yields:
+        utils.Character: The validated character
+    """
+    for char in chars:
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            char.validate()
+        char.report = out.getvalue()
+        yield char
+
+
+def serialize(chars, fmt="yaml"):
+    """Serialize each character on its own
+
+    In ``yaml`` format every character is a separate document of a YAML stream,
+    in ``binary`` format every character is a separate pickle of ``{name: data}``.
+
+    Yields:
+        str or bytes: The serialized character
+    """
+    for char in chars:
+        out = {char.name: char.data}
+        if fmt == "yaml":
+            yield yaml.dump(out, Dumper=Dumper, default_flow_style=False, explicit_start=True)
+        elif fmt == "binary":
+            yield pickle.dumps(out, protocol=pickle.HIGHEST_PROTOCOL)
+        else:
+            raise ValueError("Unknown format {}, expected one of {}".format(fmt, FORMATS))
+
+
+def batched(iterable, size):
+    """Split an iterable in lists of at most ``size`` items"""
+    it = iter(iterable)
+    while True:
+        batch = list(itertools.islice(it, size))
+        if not batch:
+            return
+        yield batch
+
+
+def process_batch(batch, char_class=PlayerCharacter, fmt="yaml", records=False, validate=False):
+    """Run the build, validate and serialize stages on a batch
+
+    Records that cannot be built or validated are reported as illegal characters and left out of the output,
+    so a malformed record does not stop the whole stream.
+
+    Args:
+        batch (list): The ``(name, age)`` rolls, or the ``(name, data)`` records when ``records`` is set.
+        char_class (type): The class of the characters.
+        fmt (str): The output format.
+        records (bool): Build the characters from their data instead of generating them.
+        validate (bool): Validate the characters.
+
+    Returns:
+        tuple: The serialized batch, the validation messages of the illegal characters and the number of
+            characters serialized
+    """
+    chunks = []
+    report = []
+    for item in batch:
+        try:
+            chars = from_data([item], char_class) if records else build([item], char_class)
+            if validate:
+                chars = validated(chars)
+            char, = chars
+            chunks.extend(serialize([char], fmt))
+        except Exception as e:
+            if not records:
+                raise
+            report.append("{}:\n{}: {}\n".format(item[0], type(e).__name__, e))
+            continue
+        if validate and not char.is_legal:
+            report.append("{}:\n{}".format(char.name, char.report))
+    joiner = "" if fmt == "yaml" else b""
+    return joiner.join(chunks), "".join(report), len(chunks)
+
+
+def _sendable(e):
+    """Get an error that can be sent to the parent, falling back to the traceback if it cannot be pickled"""
+    try:
+        pickle.dumps(e)
+    except Exception:
+        e = RuntimeError(traceback.format_exc())
+    return e
+
+
+def _worker(tasks, results, *args):
+    # Forked workers share the parent random state, reseed to avoid identical characters
+    random.seed()
+    try:
+        while True:
+            batch = tasks.get()
+            if batch is None:
+                break
+            results.put(process_batch(batch, *args))
+    except Exception as e:
+        # Send the error to the parent to be raised there
+        results.put(_sendable(e))
+        return
+    results.put(None)
+
+
+def _feed(batches, tasks, results, workers, fed):
+    try:
+        for batch in batches:
+            tasks.put(batch)
+    except Exception as e:
+        # Reading the input failed, the parent raises the error and stops the workers
+        results.put(_sendable(e))
+    else:
+        for _ in range(workers):
+            tasks.put(None)
+    fed.set()
+
+
+def _run_workers(batches, workers, queue_size, args):
+    """Process the batches in ``workers`` processes, yielding the results in completion order"""
+    tasks = multiprocessing.Queue(queue_size)
+    results = multiprocessing.Queue(queue_size)
+    procs = [
+        multiprocessing.Process(target=_worker, args=(tasks, results) + args, daemon=True)
+        for _ in range(workers)
+    ]
+    for p in procs:
+        p.start()
+    fed = threading.Event()
+    feeder = threading.Thread(target=_feed, args=(batches, tasks, results, workers, fed), daemon=True)
+    feeder.start()
+
+    try:
+        done = 0
+        while done < workers:
+            try:
+                result = results.get(timeout=1)
+            except queue.Empty:
+                # A worker killed without reaching its sentinel, or a feeder stopped without sending them,
+                # would leave us waiting forever
+                for p in procs:
+                    if p.exitcode:
+                        raise RuntimeError("Worker {} exited with code {}".format(p.pid, p.exitcode))
+                if not feeder.is_alive() and not fed.is_set():
+                    raise RuntimeError("The feeder thread stopped before sending all the batches")
+                continue
+            if result is None:
+                done += 1
+            elif isinstance(result, Exception):
+                raise result
+            else:
+                yield result
+        feeder.join()
+    finally:
+        for p in procs:
+            if p.is_alive():
+                p.terminate()
+            p.join()
+        # Do not wait at exit to flush batches nobody will read
+        tasks.cancel_join_thread()
+        results.cancel_join_thread()
+
+
+def generate(path, count=None, char_class=PlayerCharacter, age=None, fmt="yaml", workers=None,
+             batch_size=100, queue_size=None, records=None, validate=False, report=None):
+    """Generate ``count`` characters and stream them to ``path`` as they are produced
+
+    Rolls are split in batches and handed to the worker processes through a bounded queue,
+    the serialized batches are written to disk as soon as they are ready: the memory used
+    depends on ``batch_size`` and ``queue_size`` and not on ``count``.
+    When more than one worker is used the characters are written in completion order.
+    An error in a worker, or in reading ``records``, stops the workers and is raised again here.
+
+    Existing characters can be streamed through the same stages passing their ``(name, data)``
+    pairs as ``records``, e.g. from :func:`load`, to validate them.
+
+    Args:
+        path (str): The output file.
+        count (int): The number of characters to generate, ignored when ``records`` is set.
+        char_class (type): The class of the characters to generate.
+        age (int): When set every character gets this age.
+        fmt (str): Either ``yaml`` (a YAML stream) or ``binary`` (consecutive pickles).
+        workers (int): The number of worker processes, defaults to the number of CPUs.
+            With 0 the pipeline runs in the current process.
+        batch_size (int): The number of characters per batch.
+        queue_size (int): The maximum number of pending batches, defaults to twice the workers.
+        records (iterable): The ``(name, data)`` pairs of the characters to build instead of generating them.
+        validate (bool): Validate each character before serializing it.
+        report (str): The file where the validation messages of the illegal characters are written,
+            by default they are discarded. Records that cannot be built or validated are reported there too.
+
+    Returns:
+        int: The number of characters written
+    """
+    if fmt not in FORMATS:
+        raise ValueError("Unknown format {}, expected one of {}".format(fmt, FORMATS))
+    if records is None and count is None:
+        raise ValueError("Either count or records is needed")
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    batches = batched(roll(count, age) if records is None else records, batch_size)
+    args = (char_class, fmt, records is not None, validate)
+
+    if workers == 0:
+        results = (process_batch(batch, *args) for batch in batches)
+    else:
+        results = _run_workers(batches, workers, queue_size or 2 * workers, args)
+
+    written = 0
+    with open(path, "w" if fmt == "yaml" else "wb") as f, open(report or os.devnull, "w") as r:
+        for chunk, messages, n in results:
+            f.write(chunk)
+            r.write(messages)
+            written += n
+    return written
+
+
+def load(path, fmt="yaml"):
+    """Read back a file written by :func:`generate` one character at a time
+
+    Yields:
+        tuple: ``(name, data)``
+    """
+    if fmt == "yaml":
+        with open(path) as f:
+            for doc in yaml.load_all(f, Loader=Loader):
+                yield doc.popitem()
+    elif fmt == "binary":
+        with open(path, "rb") as f:
+            while True:
+                try:
+                    yield pickle.load(f).popitem()
+                except EOFError:
+                    return
+    else:
+        raise ValueError("Unknown format {}, expected one of {}".format(fmt, FORMATS))
@@ -58,6 +58,75 @@ ages = [
     ("80+", "Venerable")
 ]
 
+# The youngest age in years of each age bracket
+age_bounds = [0, 10, 14, 18, 30, 50, 70, 80]
+
+abilities = [
+    "Agility", "Animal Handling", "Athletics", "Awareness", "Cunning", "Deception",
+    "Endurance", "Fighting", "Healing", "Knowledge", "Language", "Marksmanship",
+    "Persuasion", "Status", "Stealth", "Survival", "Thievery", "Warfare", "Will"
+]
+
+# Entries of the abilities data that are not abilities: points to spend and the hints written on generation
+ability_notes = {
+    "Experience", "Abilities Points", "Specialties points", "Abilities List", "Abilities Costs", "Specialties Costs",
+    "1 or 2 abilities", "if first ability is 4 chose another two", "2 or 3 specialties",
+    "1 ability", "2 ablities", "4 abilities", "4 specialties"
+}
+
+# Ability and specialty costs by rank, ranks from 0 to 10
+ranks = range(11)
+
+# Experience needed to buy an ability at the rank used as index, rank 2 is free (p50)
+ability_costs = [(rank - 2) * 30 - 20 if rank > 2 else 0 for rank in ranks]
+
+# Specialty points needed to buy a specialty at the rank used as index (p51)
+specialty_costs = [rank * 10 for rank in ranks]
+
+# Rank of the specialties of a tier 2 non player character with the ability at the rank used as index
+half_ranks = [rank // 2 for rank in ranks]
+
+
+def parse_abilities(data):
+    """Parse the abilities data of a character
+
+    Args:
+        data (dict): The abilities data of a character.
+
+    Returns:
+        tuple: The ``Ability`` of each ability name and the problems preventing the validation of the other entries:
+            unknown abilities, malformed entries and ranks outside the cost tables
+    """
+    parsed = {}
+    errors = []
+    for name, value in data.items():
+        if name in ability_notes:
+            continue
+        if name not in abilities:
+            errors.append("{} is not an ability".format(name))
+            continue
+        if type(value) == dict and "Stat" not in value:
+            errors.append("{} has specialties but no Stat".format(name))
+            continue
+        if type(value) not in (int, dict):
+            errors.append("{} rank {!r} is not a number".format(name, value))
+            continue
+        ab = Ability.from_data(name, value)
+        legal = True
+        for entry, rank in [(name, ab.rank)] + list(ab.specialties.items()):
+            if type(rank) != int:
+                errors.append("{} rank {!r} is not a number".format(entry, rank))
+                legal = False
+            elif rank < ranks[0]:
+                errors.append("{} at {} is below the minimum value of {}".format(entry, rank, ranks[0]))
+                legal = False
+            elif rank > ranks[-1]:
+                errors.append("{} at {} exceeds the maximum value of {}".format(entry, rank, ranks[-1]))
+                legal = False
+        if legal:
+            parsed[name] = ab
+    return parsed, errors
+
 
 def roller(n):
     """Rolls nd6"""
@@ -67,8 +136,9 @@ def roller(n):
     return res
 
 
-def set_status():
-    roll = roller(2)
+def set_status(roll=None):
+    if roll is None:
+        roll = roller(2)
     if roll == 2:
         return 2
     elif roll <= 4:
@@ -119,11 +189,60 @@ def age_to_val(age):
         return 7
 
 
+def val_to_age(val):
+    """Get the youngest age in years of an age bracket, the inverse of ``age_to_val``"""
+    return age_bounds[val]
+
+
+class Ability:
+    """An ability with its specialties
+
+    Args:
+        name (str): The name of the ability.
+        rank (int): The rank of the ability.
+        specialties (dict): The rank of each specialty of the ability.
+    """
+    __slots__ = ("name", "rank", "specialties")
+
+    def __init__(self, name, rank=2, specialties=None):
+        self.name = name
+        self.rank = rank
+        self.specialties = specialties or {}
+
+    @classmethod
+    def from_data(cls, name, value):
+        """Build an ability from its character data, either the rank or a dictionary with ``Stat`` and specialties"""
+        if type(value) == dict:
+            specialties = {spec: val for spec, val in value.items() if spec != "Stat"}
+            return cls(name, value["Stat"], specialties)
+        return cls(name, value)
+
+    def to_data(self):
+        """Get the ability in the format used by the character data"""
+        if not self.specialties:
+            return self.rank
+        data = {"Stat": self.rank}
+        data.update(self.specialties)
+        return data
+
+    @property
+    def cost(self):
+        """The experience needed to buy the ability"""
+        return ability_costs[self.rank]
+
+    @property
+    def specialty_cost(self):
+        """The specialty points needed to buy all the specialties"""
+        return sum(specialty_costs[val] for val in self.specialties.values())
+
+
 class Character:
     """Class to be extended for specific use depending on the particular type of character needing to be represented
     
     It provides a basic initialization and a few helper methods; it also defines abstract methods needing implementation
-    in subclasses
+    in subclasses.
+    The abilities data is parsed on creation in the ``abilities`` attribute, a dictionary of ``Ability`` by name,
+    and parsed again at the start of the validation of the abilities to take into account any change to the data.
     
     Args:
         name (str): The name of the character.
@@ -136,9 +255,11 @@ class Character:
         if data:
             self.data = data
             self.ageVal = age if age else age_to_val(data["Background"]["Age"])
+            self.age = data["Background"]["Age"]
             self.exp = data["Abilities"]["Experience"]
         else:
             self.ageVal = age_to_val(age) if age is not None else set_age()
+            self.age = age if age is not None else val_to_age(self.ageVal)
             self.data = {
                 "Armor": None,
                 "Arms": None,
@@ -146,6 +267,7 @@ class Character:
                 "Attributes": self.generate_attributes(),
                 "Derived": self.calculate_derived()
             }
+        self.abilities, self.ability_errors = parse_abilities(self.data["Abilities"])
 
     def __str__(self):
         out = {self.name: self.data}
@@ -227,6 +349,22 @@ class Character:
             return False
         return True
 
+    def validate_ability_entries(self):
+        """Parse the abilities data again and report the entries that cannot be validated
+
+        Unknown abilities, malformed entries and ranks outside the cost tables make the character illegal.
+
+        Returns:
+            bool: True if every entry is a valid ability
+        """
+        self.abilities, self.ability_errors = parse_abilities(self.data["Abilities"])
+        for error in self.ability_errors:
+            print(error)
+        if self.ability_errors:
+            self.is_legal = False
+            return False
+        return True
+
     @abc.abstractmethod
     def validate_abilities(self):
         """Check if the abilities of the character adhere to the rules
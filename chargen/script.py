@@ -2,7 +2,7 @@
 
 import argparse
 import yaml
-from .chargen import classes
+from .chargen import classes, pipeline
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
@@ -11,10 +11,25 @@ if __name__ == "__main__":
     parser.add_argument("-f", "--file", default=None, help="A properly formatted YAML file containing a character")
     parser.add_argument("-a", "--age", default=None, type=int, help="The age of the character to be created")
     parser.add_argument("-n", "--name", default="Ser Example", help="The name of the character to be created")
+    parser.add_argument("-c", "--count", default=None, type=int, help="Stream this many characters to --output")
+    parser.add_argument("-o", "--output", default="characters.yml", help="The output file when generating many characters")
+    parser.add_argument("--format", default="yaml", choices=pipeline.FORMATS, help="The format of --output")
+    parser.add_argument("-w", "--workers", default=None, type=int, help="The number of worker processes")
+    parser.add_argument("--validate", action="store_true",
+                        help="Validate the stream of characters in --file, writing them to --output")
+    parser.add_argument("-r", "--report", default=None, help="The file where the illegal characters are reported")
 
     args = parser.parse_args()
 
-    if args.file:
+    if args.validate and not args.file:
+        parser.error("--validate needs a --file to read the characters from")
+
+    if args.validate:
+        pipeline.generate(args.output, records=pipeline.load(args.file, args.format), fmt=args.format,
+                          workers=args.workers, validate=True, report=args.report)
+    elif args.count:
+        pipeline.generate(args.output, args.count, age=args.age, fmt=args.format, workers=args.workers)
+    elif args.file:
         with open(args.file) as f:
             raw = yaml.load(f)
         name, data = raw.popitem()
@@ -0,0 +1,99 @@
+import unittest
+import numpy as np
+from chargen.chargen import advancement, utils, PlayerCharacter, NCTier1
+
+
+class AdvancementTest(unittest.TestCase):
+    def test_costs(self):
+        """Raising abilities should cost the same as buying them in ``validate_abilities``"""
+        self.assertEqual(0, advancement.step_cost[1])
+        self.assertEqual(10, advancement.step_cost[2])
+        self.assertEqual(30, advancement.step_cost[3])
+        self.assertEqual(70, sum(advancement.step_cost[2:5]))
+
+    def test_max_rank(self):
+        """Abilities should never be raised above the maximum rank for the age"""
+        roster = advancement.Roster([25] * 50, exp=[10000] * 50, purchases=50, seed=2)
+        roster.advance(4)
+        self.assertEqual(PlayerCharacter.ab_max_rank[3], roster.ranks.max())
+
+        # Crossing from Adult into Middle Age lowers the maximum and refunds the ranks lost
+        roster.exp_gains = [0]
+        roster.purchases = 0
+        ranks = roster.ranks.copy()
+        exp = roster.exp.copy()
+        roster.tick()
+        self.assertEqual(4, roster.age_vals[0])
+        self.assertEqual(PlayerCharacter.ab_max_rank[4], roster.ranks.max())
+        refund = np.take(utils.ability_costs, ranks).sum(axis=1) - np.take(utils.ability_costs, roster.ranks).sum(axis=1)
+        gained = PlayerCharacter.ab_points[4] - PlayerCharacter.ab_points[3]
+        self.assertEqual(list(exp + refund + gained), list(roster.exp))
+        self.assertTrue((refund > 0).any())
+
+    def test_experience_gain(self):
+        """Experience should be gained every year"""
+        roster = advancement.Roster([20] * 50, exp=[0] * 50, purchases=0)
+        roster.advance(3)
+        self.assertTrue(all(30 <= exp <= 180 for exp in roster.exp))
+        self.assertEqual({2}, set(roster.ranks.flat))
+
+    def test_experience_spent(self):
+        """Raising ranks should cost exactly their step cost and never leave negative experience"""
+        roster = advancement.Roster([20] * 200, exp=list(range(0, 2000, 10)), purchases=5, seed=3)
+        roster.exp_gains = [0]
+        before = roster.ranks.copy()
+        exp = roster.exp.copy()
+        roster.tick()
+        costs = np.take(utils.ability_costs, roster.ranks) - np.take(utils.ability_costs, before)
+        self.assertTrue((roster.exp >= 0).all())
+        self.assertTrue((roster.ranks > before).any())
+        self.assertEqual(list(exp - costs.sum(axis=1)), list(roster.exp))
+
+    def test_age_brackets(self):
+        """Crossing into a new age bracket should grant its points and background events"""
+        roster = advancement.Roster([29], exp=[0], purchases=0)
+        roster.advance(1)
+        data = roster.character_data(0)
+        self.assertEqual(30, data["Background"]["Age"])
+        self.assertEqual(4, roster.age_vals[0])
+        self.assertEqual(4, len(data["Background"]["Events"]))
+        self.assertEqual(20, data["Abilities"]["Specialties points"])
+        self.assertGreaterEqual(data["Abilities"]["Experience"], 40)
+
+    def test_from_characters(self):
+        """Characters should keep their ranks and unspent points when added to a roster"""
+        chars = [NCTier1(age=20) for _ in range(5)]
+        roster = advancement.Roster.from_characters(chars)
+        for i, char in enumerate(chars):
+            self.assertEqual(char.get_rank("Status"), roster.get_rank(i, "Status"))
+            abilities = char.data["Abilities"]
+            self.assertEqual(abilities["Experience"] + abilities["Abilities Points"], roster.exp[i])
+            self.assertEqual(20, roster.ages[i])
+            self.assertCountEqual(char.data["Background"]["Events"], roster.character_data(i)["Background"]["Events"])
+
+    def test_generate(self):
+        """Experience spent over the years should match the ability costs of the ranks bought
+
+        Starting experience plus the yearly gains and the points of the age brackets crossed should equal
+        the experience left plus the cost of the ranks bought, refunds for lowered maximums included.
+        """
+        roster = advancement.Roster.generate(2000, seed=1)
+        roster.exp_gains = [30]
+        self.assertTrue((roster.events.sum(axis=1) == roster.age_vals).all())
+        self.assertTrue((roster.ranks <= np.take(PlayerCharacter.ab_max_rank, roster.age_vals)[:, None]).all())
+        exp = roster.exp.copy()
+        vals = roster.age_vals.copy()
+        cost = np.take(utils.ability_costs, roster.ranks).sum(axis=1)
+
+        roster.advance(30)
+        self.assertTrue((roster.age_vals > vals).any())
+        self.assertEqual((2000, len(utils.abilities)), roster.ranks.shape)
+        self.assertTrue((roster.exp >= 0).all())
+        self.assertTrue((roster.events.sum(axis=1) == roster.age_vals).all())
+
+        gained = 30 * 30 + np.take(PlayerCharacter.ab_points, roster.age_vals) - np.take(PlayerCharacter.ab_points, vals)
+        spent = np.take(utils.ability_costs, roster.ranks).sum(axis=1) - cost
+        self.assertEqual(list(exp + gained), list(roster.exp + spent))
+
+if __name__ == '__main__':
+    unittest.main()
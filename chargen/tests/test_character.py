@@ -1,5 +1,5 @@
 import unittest
-from chargen.chargen import PlayerCharacter
+from chargen.chargen import Ability, PlayerCharacter, NCTier2, NCTier3
 
 
 class GenerationTest(unittest.TestCase):
@@ -14,10 +14,16 @@ class GenerationTest(unittest.TestCase):
     def test_abilities_generation(self):
         """Number of ability points should be correct for the age of the character"""
         result = self.PC.data["Abilities"]["Abilities Points"]
-        status_exp = (self.PC.get_rank("Status") - 2) * 30 - 20
+        status_exp = {2: 0, 3: 10, 4: 40, 5: 70, 6: 100}[self.PC.get_rank("Status")]
         expected = self.PC.ab_points[self.PC.ageVal] - status_exp
         self.assertEqual(expected, result)
 
+    def test_generated_abilities(self):
+        """Generated characters should only list the Status among their abilities"""
+        for char in [self.PC, NCTier2(), NCTier3()]:
+            self.assertEqual(["Status"], list(char.abilities))
+            self.assertEqual([], char.ability_errors)
+
     def test_benefit_generation(self):
         """Value of `maximum benefits` should be correct for the age of the character"""
         self.assertEqual(self.PC.max_benefits[self.PC.ageVal], self.PC.data["Attributes"]["Benefits"]["max"])
@@ -36,5 +42,99 @@ class GenerationTest(unittest.TestCase):
         """Number of background events should be correct for the age of the character"""
         self.assertEqual(self.PC.ageVal, len(self.PC.data["Background"]["Events"]))
 
-    if __name__ == '__main__':
-        unittest.main()
+
+class ValidationTest(unittest.TestCase):
+    def character(self, cls, abilities, flaws=None):
+        abilities["Experience"] = 0
+        data = {
+            "Abilities": abilities,
+            "Attributes": {"Benefits": {}, "Drawbacks": {"Flaws": flaws or []}},
+            "Background": {"Age": 20}
+        }
+        return cls(data=data)
+
+    def test_ability_data(self):
+        """Abilities should round trip through the character data format"""
+        ab = Ability.from_data("Fighting", {"Stat": 4, "Long Blades": 2})
+        self.assertEqual(4, ab.rank)
+        self.assertEqual({"Long Blades": 2}, ab.specialties)
+        self.assertEqual(40, ab.cost)
+        self.assertEqual(20, ab.specialty_cost)
+        self.assertEqual({"Stat": 4, "Long Blades": 2}, ab.to_data())
+        self.assertEqual(3, Ability.from_data("Agility", 3).to_data())
+
+    def test_specialty_points(self):
+        """Specialties should cost 10 points per rank"""
+        char = self.character(PlayerCharacter, {
+            "Fighting": {"Stat": 4, "Long Blades": 3, "Shields": 1},
+            "Persuasion": {"Stat": 3, "Charm": 2}
+        })
+        legal, spent = char.validate_specialties(char.abilities["Fighting"])
+        self.assertTrue(legal)
+        self.assertEqual(40, spent)
+        self.assertTrue(char.validate_abilities())
+
+    def test_specialty_points_exceeded(self):
+        """Spending more than the specialty points for the age should make the character illegal"""
+        char = self.character(PlayerCharacter, {
+            "Fighting": {"Stat": 5, "Long Blades": 5, "Shields": 4},
+            "Persuasion": {"Stat": 3, "Charm": 3}
+        })
+        self.assertFalse(char.validate_abilities())
+
+    def test_specialty_above_rank(self):
+        """Specialties should not exceed the ability rank"""
+        char = self.character(PlayerCharacter, {"Fighting": {"Stat": 3, "Long Blades": 4}})
+        legal, _ = char.validate_specialties(char.abilities["Fighting"])
+        self.assertFalse(legal)
+
+    def test_unknown_ability(self):
+        """Unknown abilities should make the character illegal"""
+        char = self.character(PlayerCharacter, {"Fightin": 7, "Agility": 3})
+        self.assertEqual(["Agility"], list(char.abilities))
+        self.assertFalse(char.validate_abilities())
+        self.assertFalse(char.is_legal)
+
+    def test_rank_beyond_tables(self):
+        """Ranks beyond the cost tables should be reported instead of raising"""
+        char = self.character(PlayerCharacter, {"Fighting": 11, "Persuasion": {"Stat": 3, "Charm": 12}})
+        self.assertEqual([], list(char.abilities))
+        self.assertFalse(char.validate_abilities())
+        self.assertFalse(self.character(NCTier2, {"Fighting": 11}).validate_abilities())
+
+    def test_malformed_ranks(self):
+        """Negative and non numeric ranks should be reported instead of costed or raising"""
+        for abilities in [
+            {"Fighting": -1}, {"Fighting": "3"}, {"Fighting": None}, {"Fighting": {"Long Blades": 2}},
+            {"Fighting": {"Stat": 3, "Long Blades": -1}}, {"Fighting": {"Stat": "3"}}
+        ]:
+            char = self.character(PlayerCharacter, abilities)
+            self.assertEqual({}, char.abilities)
+            self.assertFalse(char.validate_abilities())
+        self.assertFalse(self.character(NCTier2, {"Fighting": {"Stat": 4, "Long Blades": -2}}).validate_abilities())
+
+    def test_edited_abilities(self):
+        """Validation should check the abilities data as it is, not as it was on creation"""
+        char = self.character(PlayerCharacter, {"Fighting": 3})
+        char.data["Abilities"]["Fighting"] = 9
+        char.data["Abilities"]["Agility"] = 4
+        self.assertFalse(char.validate_abilities())
+        self.assertEqual({"Fighting": 9, "Agility": 4}, {name: ab.rank for name, ab in char.abilities.items()})
+
+    def test_flawed_max_rank(self):
+        """A flaw pushing an ability beyond the maximum should be reported instead of raising"""
+        char = self.character(PlayerCharacter, {"Fighting": 10}, flaws=["Fighting"])
+        self.assertFalse(char.validate_abilities())
+        char = self.character(PlayerCharacter, {"Fighting": 7}, flaws=["Fighting"])
+        self.assertFalse(char.validate_abilities())
+
+    def test_tier2_half_rank(self):
+        """Tier 2 specialties should be at half the ability rank"""
+        char = self.character(NCTier2, {"Fighting": {"Stat": 5, "Long Blades": 2, "Shields": 3}})
+        legal, spent = char.validate_specialties(char.abilities["Fighting"])
+        self.assertFalse(legal)
+        self.assertEqual(2, spent)
+
+
+if __name__ == '__main__':
+    unittest.main()
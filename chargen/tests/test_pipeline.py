@@ -0,0 +1,128 @@
+import contextlib
+import copy
+import io
+import os
+import tempfile
+import unittest
+from chargen.chargen import pipeline, NCTier1
+
+
+class BrokenCharacter(NCTier1):
+    def __init__(self, name="Ser Example", data=None, age=None):
+        raise KeyError(name)
+
+
+class DyingCharacter(NCTier1):
+    def __init__(self, name="Ser Example", data=None, age=None):
+        os._exit(3)
+
+
+class PipelineTest(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_yaml_stream(self):
+        """Every generated character should be written as its own YAML document"""
+        written = pipeline.generate(self.path, 25, workers=2, batch_size=4)
+        chars = list(pipeline.load(self.path))
+        self.assertEqual(25, written)
+        self.assertEqual(25, len(chars))
+        self.assertEqual(25, len({name for name, _ in chars}))
+
+    def test_binary_stream(self):
+        """Binary output should round trip the character data"""
+        pipeline.generate(self.path, 10, char_class=NCTier1, fmt="binary", workers=0, batch_size=3)
+        chars = list(pipeline.load(self.path, fmt="binary"))
+        self.assertEqual(10, len(chars))
+        for name, data in chars:
+            self.assertIn("Experience", data["Abilities"])
+
+    def test_fixed_age(self):
+        """A fixed age should be used for every rolled character"""
+        ages = {age for _, age in pipeline.roll(20, age=45)}
+        self.assertEqual({45}, ages)
+
+    def example_records(self, count):
+        example = os.path.join(os.path.dirname(__file__), "..", "example char.yml")
+        name, data = next(pipeline.load(example))
+        data["Abilities"]["Experience"] = 0
+        return [("{} {}".format(name, i), copy.deepcopy(data)) for i in range(count)]
+
+    def test_validate_stage(self):
+        """Characters loaded from a stream should go through validation and back to YAML"""
+        chars = list(pipeline.validated(pipeline.from_data(self.example_records(1))))
+        self.assertEqual(["Ser Example 0"], [char.name for char in chars])
+        self.assertIn("Ability points: starting 240, left: -40", chars[0].report)
+        out = "".join(pipeline.serialize(chars))
+        self.assertTrue(out.startswith("---"))
+
+    def test_validate_records(self):
+        """Validating records should write them and report the illegal ones without printing"""
+        report = self.report_path()
+        for workers in (0, 2):
+            with contextlib.redirect_stdout(io.StringIO()) as out:
+                written = pipeline.generate(
+                    self.path, records=self.example_records(7), validate=True, report=report,
+                    workers=workers, batch_size=3
+                )
+            self.assertEqual("", out.getvalue())
+            self.assertEqual(7, written)
+            self.assertEqual(7, len(list(pipeline.load(self.path))))
+            with open(report) as f:
+                self.assertEqual(7, f.read().count("left: -40"))
+
+    def report_path(self):
+        fd, report = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.remove, report)
+        return report
+
+    def test_round_trip(self):
+        """Generated characters should be loaded back and validated"""
+        pipeline.generate(self.path, 5, workers=0)
+        fd, out = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.remove, out)
+        written = pipeline.generate(out, records=pipeline.load(self.path), validate=True,
+                                    report=self.report_path(), workers=2)
+        self.assertEqual(5, written)
+        self.assertEqual([name for name, _ in pipeline.load(self.path)], [name for name, _ in pipeline.load(out)])
+
+    def test_malformed_records(self):
+        """Records that cannot be built should be reported without stopping the stream"""
+        report = self.report_path()
+        records = self.example_records(4)
+        records[1] = ("Broken", {"Abilities": {}})
+        written = pipeline.generate(self.path, records=records, validate=True, report=report, workers=0)
+        self.assertEqual(3, written)
+        self.assertNotIn("Broken", [name for name, _ in pipeline.load(self.path)])
+        with open(report) as f:
+            self.assertIn("Broken:\nKeyError", f.read())
+
+    def test_worker_error(self):
+        """An error in a worker should be raised by generate instead of hanging it"""
+        with self.assertRaises(KeyError):
+            pipeline.generate(self.path, 50, char_class=BrokenCharacter, workers=2, batch_size=5)
+
+    def test_feeder_error(self):
+        """An error reading the records should be raised by generate instead of hanging it"""
+        missing = os.path.join(tempfile.gettempdir(), "missing", "characters.yml")
+        with self.assertRaises(FileNotFoundError):
+            pipeline.generate(self.path, records=pipeline.load(missing), validate=True, workers=2)
+
+    def test_worker_killed(self):
+        """A worker exiting without its sentinel should not hang generate"""
+        with self.assertRaises(RuntimeError):
+            pipeline.generate(self.path, 50, char_class=DyingCharacter, workers=2, batch_size=5)
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            pipeline.generate(self.path, 1, fmt="json", workers=0)
+
+
+if __name__ == '__main__':
+    unittest.main()